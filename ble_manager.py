@@ -1,14 +1,16 @@
 # ble_manager.py
 import bluetooth
+import os
 import time
 from ble_peripheral import BLEPeripheral
 import config
 import json
+from data_processor import to_units_line, count_records, clear_records
 
 # ------------------------- [BLEManager Class Definition] -------------------------
 class BLEManager:
-    def __init__(self):
-        """Initialize BLEManager class"""
+    def __init__(self, sampler=None):
+        """Initialize BLEManager class (pass the core 1 Sampler to run in dual-core mode)"""
         ble = bluetooth.BLE()
         self._ble = ble
         
@@ -18,8 +20,17 @@ class BLEManager:
         self.period = config.DEFAULT_PERIOD  # Default logging period setting
         self.interval = config.ADVERTISE_INTERVAL 
         self.command = None  # Command to execute
+        self.old_data_file = config.OLD_DATA_FILE in os.listdir()  # Unconvertible data moved aside at startup
         self.partial_data = ""  # Buffer to store fragmented data
 
+        # Dual-core mode: records arrive from core 1, sync acks go back via the main loop
+        self.sampler = sampler
+        self.pending = []  # (seq, line) pairs received from core 1 but not yet sent (at most RING_CAPACITY)
+        self.synced_seq = -1  # Highest sequence number sent, forwarded to core 1 by the main loop
+        self.name_update = (0, self._name)  # (version, name) to be saved by core 1, forwarded by the main loop
+        self.forwarded_seq = -1  # Written only by the main loop
+        self.forwarded_name_version = 0  # Written only by the main loop
+
         # Initialize BLE device and register event handler
         self.perip = BLEPeripheral(self._ble, self._name, self.interval)
         self.perip.on_write(self.on_rx)
@@ -38,8 +49,12 @@ class BLEManager:
     def set_ble_name(self, new_name):
         """Change BLE name and restart advertising"""
         self._name = new_name
-        with open(config.NAME_FILE, "w") as f:
-            f.write(new_name)
+        if self.sampler is not None:
+            # Core 1 owns flash in dual-core mode; the main loop forwards the name to it
+            self.name_update = (self.name_update[0] + 1, new_name)
+        else:
+            with open(config.NAME_FILE, "w") as f:
+                f.write(new_name)
 
         # Reinitialize BLE device
         self.perip = BLEPeripheral(self._ble, self._name, self.interval)
@@ -80,6 +95,7 @@ class BLEManager:
             latest_time = data.get("latest_time", self.latest_time)
             period = data.get("period", self.period)
             name = data.get("name", None)
+            export_format = data.get("format", config.EXPORT_FORMATS[0])
 
             if period is None:
                 period = self.period
@@ -87,6 +103,9 @@ class BLEManager:
             if command not in ["setting", "update"]:
                 return {"status": "error", "message": "Unknown command"}
 
+            if export_format not in config.EXPORT_FORMATS:
+                return {"status": "error", "message": "Unknown format"}
+
             self.command = command
             self.latest_time = latest_time
             self.period = period
@@ -95,8 +114,13 @@ class BLEManager:
                 self.set_ble_name(name)
 
             if command == "update":
-                success = self.send_csv_data()
-                return {"status": "success" if success else "error", "message": "Data update"}
+                success = self.send_csv_data(export_format)
+                return {
+                    "status": "success" if success else "error",
+                    "message": "Data update",
+                    "remaining": self.count_unsent_data(),  # Send "update" again while > 0
+                    "old_data_file": self.old_data_file
+                }
                 
             elif command == "setting":
                 return {
@@ -106,7 +130,8 @@ class BLEManager:
                         "latest_time": self.latest_time,
                         "period": self.period,
                         "name": self._name
-                    }
+                    },
+                    "old_data_file": self.old_data_file
                 }
 
         except Exception as e:
@@ -115,19 +140,16 @@ class BLEManager:
             return {"status": "error", "message": str(e)}
     
     # ------------------------- [CSV Data Transmission and Management] -------------------------      
-    def send_csv_data(self):
-        """Send CSV file via BLE"""
+    def send_csv_data(self, export_format="raw"):
+        """Send CSV file via BLE ('raw' counts as stored, or converted to 'units')"""
         batch_size = config.BLE_CHUNK_SIZE
 
         try:
-            with open(config.DATA_FILE, "r") as file:
-                lines = [line.strip() for line in file.readlines()]  # Read entire file
+            data_lines = self.load_unsent_data()
                 
-            if len(lines) <= 1:
+            if not data_lines:
                 self.perip.send(json.dumps({"status": "success", "message": "No data available"}))
                 return True
-            
-            data_lines = lines[1:]  # Extract only data lines
 
             total_batches = (len(data_lines) + batch_size - 1) // batch_size  # Calculate total batches
             print(f"📡 Sending {len(data_lines)} lines via BLE in {total_batches} batches...")
@@ -138,6 +160,8 @@ class BLEManager:
             
             for i in range(0, len(data_lines), batch_size):  # Send in batches of 10 lines
                 batch_data = data_lines[i:i + batch_size]  # Extract batch data
+                if export_format == "units":
+                    batch_data = [to_units_line(line) for line in batch_data]
 
                 # 🚀 Package data in JSON format
                 json_payload = json.dumps({
@@ -145,6 +169,7 @@ class BLEManager:
                         "index": i // batch_size + 1,
                         "total": total_batches
                     },
+                    "format": export_format,
                     "data": batch_data
                 })
 
@@ -159,19 +184,44 @@ class BLEManager:
                 time.sleep(0.3)
 
             print("✅ File sent successfully.")
-            self.clear_sent_data()
+            self.clear_sent_data(len(data_lines))
 
             return True
 
         except OSError:
             return False
 
-    def clear_sent_data(self):
-        """Clear CSV file completely and rewrite header"""
-        try:
-            with open(config.DATA_FILE, "w") as file:
-                file.write(",".join(config.DATA_HEADER) + "\n")  # Store header
+    def load_unsent_data(self):
+        """Return unsent data lines (handed over by core 1 in dual-core mode, otherwise read from the CSV file)"""
+        if self.sampler is not None:
+            records = self.sampler.records
+            while len(self.pending) < config.RING_CAPACITY:
+                record = records.get()
+                if record is None:
+                    break
+                self.pending.append(record)
+            return [line for _, line in self.pending]
+
+        with open(config.DATA_FILE, "r") as file:
+            lines = [line.strip() for line in file.readlines()]  # Read entire file
+        return lines[1:]  # Extract only data lines
+
+    def count_unsent_data(self):
+        """Return the number of data lines still waiting to be sent"""
+        if self.sampler is not None:
+            # Every line with a sequence number above the last sent one is unsent. Both values
+            # are single integers written by one side only, so the count is never inflated.
+            return self.sampler.next_seq - 1 - self.synced_seq
+        return count_records()
+
+    def clear_sent_data(self, count):
+        """Clear CSV file completely and rewrite header (in dual-core mode, ack the sent lines to core 1)"""
+        if self.sampler is not None:
+            # Core 1 trims the file by sequence number, so a failed trim is simply retried
+            self.synced_seq = self.pending[count - 1][0]
+            self.pending = self.pending[count:]
+            return
+
+        if clear_records():
             print("🗑️ Sent data cleared, only header remains.")
-        except Exception as e:
-            print(f"⚠️ Error clearing sent data: {e}")
     
\ No newline at end of file
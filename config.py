@@ -8,7 +8,9 @@ DEVICE_NAME = "MedM" + DEVICE_UID[-4:]
 
 NAME_FILE = "name.txt"
 DATA_FILE = "sensor_data.csv"
-DATA_HEADER = ["time", "tp", "hd", "cputp"]  # UID 제거
+DATA_HEADER = ["time", "tp_adc", "hd_adc", "cputp_adc"]  # UID 제거, 센서 원시값(raw count) 저장
+LEGACY_DATA_HEADER = ["time", "tp", "hd", "cputp"]  # 이전 float 형식 헤더 (시작 시 원시값으로 변환)
+OLD_DATA_FILE = "sensor_data_old.csv"  # 헤더를 알 수 없는 기존 파일은 이 이름으로 보관
 
 # 기본 로깅 설정
 DEFAULT_START_TIME = "2025-01-01 00:00:00"
@@ -18,6 +20,12 @@ DEFAULT_PERIOD = "01:00:00"
 # 광고 간격: 625μs 단위로 반올림되며, 일반적으로 20ms(20000μs) ~ 10.24s(10240000μs) 사이의 값을 사용합니다.
 ADVERTISE_INTERVAL = 5 * 1000000 # 5초 인터벌 (단위 - 마이크로초)
 BLE_CHUNK_SIZE = 10  # BLE 데이터 전송 시 한 번에 보낼 줄 수
+EXPORT_FORMATS = ["raw", "units"]  # raw: 원시값 그대로 전송, units: 단위 변환(°C, %RH) 후 전송
+
+# 듀얼 코어 설정: True이면 센서 측정 및 플래시 기록은 코어 1, BLE 처리는 코어 0에서 실행
+DUAL_CORE = False
+RING_CAPACITY = 128  # 코어 간 링 버퍼 크기 (코어 1 → 코어 0으로 전달 대기 중인 레코드 수)
+TRIM_BATCH = 512  # 전송 완료된 줄이 이 수 이상 쌓이면 파일에서 삭제 (전부 전송되면 즉시 삭제)
 
 I2C_SCL_PIN = 21  # SCL 핀 번호
 I2C_SDA_PIN = 20  # SDA 핀 번호
@@ -3,7 +3,169 @@ import os
 from dht20 import DHT20  # Using DHT20 library
 import config
 import utime
-    
+
+# ------------------------- Unit Conversion (export only) -------------------------
+# Samples are logged and sent as raw integer counts. These helpers convert them to
+# centi-units (1/100) with integer math, for the human-readable export mode only.
+def temperature_centi(t_adc):
+    """Convert a raw 20-bit DHT20 temperature count to centi-°C (t / 2^20 * 200 - 50)."""
+    return ((t_adc * 625 + (1 << 14)) >> 15) - 5000
+
+def humidity_centi(rh_adc):
+    """Convert a raw 20-bit DHT20 humidity count to centi-%RH (rh / 2^20 * 100)."""
+    return (rh_adc * 625 + (1 << 15)) >> 16
+
+def cpu_temperature_centi(adc_u16):
+    """Convert a raw 16-bit ADC count to centi-units of the CPU value (u16 * 3.3 / 65535 * 100)."""
+    return (adc_u16 * 11000 + 10922) // 21845  # 3.3 * 100 * 100 / 65535 == 11000 / 21845
+
+def format_centi(value):
+    """Format a centi-unit integer as a decimal string (e.g. 2345 -> '23.45') without floats."""
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    return "{}{}.{:02d}".format(sign, value // 100, value % 100)
+
+def to_units_line(line):
+    """Convert a raw CSV data line ('time,tp,hd,cputp') to engineering units."""
+    fields = line.split(",")
+    if len(fields) != len(config.DATA_HEADER):
+        return line  # Not a record we know how to convert
+
+    converters = (temperature_centi, humidity_centi, cpu_temperature_centi)
+    for i, convert in enumerate(converters, 1):
+        if fields[i].isdigit():  # Leave missing readings ("None") as they are
+            fields[i] = format_centi(convert(int(fields[i])))
+    return ",".join(fields)
+
+def _to_count(value, offset, scale, maximum):
+    """Convert one legacy float field back to a raw count (clamped to the sensor range)."""
+    return min(max(int((float(value) + offset) * scale + 0.5), 0), maximum)
+
+def legacy_to_raw_line(line):
+    """Convert a line logged in the old float format ('time,°C,%RH,cpu') to raw counts.
+
+    Only used once, when migrating a file written before raw counts were logged.
+    """
+    fields = line.split(",")
+    if len(fields) != len(config.LEGACY_DATA_HEADER):
+        return line  # Not a record we know how to convert
+
+    inverse = ((50, (1 << 20) / 200, (1 << 20) - 1), (0, (1 << 20) / 100, (1 << 20) - 1), (0, 65535 / 330, 65535))
+    for i, (offset, scale, maximum) in enumerate(inverse, 1):
+        try:
+            fields[i] = str(_to_count(fields[i], offset, scale, maximum))
+        except ValueError:
+            pass  # Leave missing readings ("None") as they are
+    return ",".join(fields)
+
+# ------------------------- Record File Helpers -------------------------
+HEADER_LINE = ",".join(config.DATA_HEADER) + "\n"
+
+def prepare_data_file():
+    """Create the CSV file with headers, migrating or moving aside a file whose header does not match.
+
+    Files written before raw counts were logged hold float values under
+    LEGACY_DATA_HEADER; their rows are converted so they can still be sent.
+    Files with any other header are moved to OLD_DATA_FILE.
+    """
+    header = HEADER_LINE.strip()
+    files = os.listdir()
+    if config.DATA_FILE in files:
+        with open(config.DATA_FILE, "r") as file:
+            current_header = file.readline().strip()
+        if current_header == header:
+            return
+        if current_header == ",".join(config.LEGACY_DATA_HEADER):
+            convert_legacy_file()
+            return
+        if config.OLD_DATA_FILE in files:
+            os.remove(config.OLD_DATA_FILE)
+        os.rename(config.DATA_FILE, config.OLD_DATA_FILE)
+        print(f"Header mismatch: moved {config.DATA_FILE} to {config.OLD_DATA_FILE}")
+
+    with open(config.DATA_FILE, "w") as file:
+        file.write(HEADER_LINE)  # Add header
+    print(f"Created new file: {config.DATA_FILE}")
+
+def convert_legacy_file():
+    """Rewrite a legacy float-format CSV file as raw counts, one line at a time."""
+    temp_file = config.DATA_FILE + ".tmp"
+    with open(config.DATA_FILE, "r") as src, open(temp_file, "w") as dst:
+        src.readline()  # Replace legacy header
+        dst.write(HEADER_LINE)
+        for line in src:
+            line = line.strip()
+            if line:
+                dst.write(legacy_to_raw_line(line) + "\n")
+    os.rename(temp_file, config.DATA_FILE)
+    print(f"Converted legacy data in {config.DATA_FILE} to raw counts")
+
+def format_record(record):
+    """Format a record list as a CSV data line."""
+    return ",".join(map(str, record))
+
+def count_records():
+    """Return the number of data lines (without header) in the CSV file."""
+    count = -1  # Do not count the header
+    try:
+        with open(config.DATA_FILE, "r") as file:
+            for _ in file:
+                count += 1
+    except OSError:
+        pass
+    return max(count, 0)
+
+def read_records(offset, limit):
+    """Return at most `limit` data lines starting at byte `offset`, and the offset after them.
+
+    Seeking to a saved offset avoids re-reading the lines before it.
+    """
+    lines = []
+    try:
+        with open(config.DATA_FILE, "r") as file:
+            file.seek(offset)
+            while len(lines) < limit:
+                line = file.readline()
+                if not line:
+                    break
+                lines.append(line.strip())
+            offset = file.tell()
+    except OSError as e:
+        print(f"Error reading records from {config.DATA_FILE}: {e}")
+    return lines, offset
+
+def clear_records():
+    """Rewrite the CSV file with only its header. Returns True on success."""
+    try:
+        with open(config.DATA_FILE, "w") as file:
+            file.write(HEADER_LINE)
+        return True
+    except Exception as e:
+        print(f"Error clearing {config.DATA_FILE}: {e}")
+        return False
+
+def drop_records(count):
+    """Remove the oldest `count` data lines from the CSV file, keeping the header.
+
+    The remaining lines are streamed into a temporary file, so the file is never
+    loaded into RAM. Returns the number of bytes removed, or None on failure.
+    """
+    temp_file = config.DATA_FILE + ".tmp"
+    try:
+        with open(config.DATA_FILE, "r") as src, open(temp_file, "w") as dst:
+            dst.write(src.readline())  # Keep header
+            start = src.tell()
+            for _ in range(count):
+                src.readline()
+            dropped = src.tell() - start
+            for line in src:
+                dst.write(line)
+        os.rename(temp_file, config.DATA_FILE)
+        return dropped
+    except Exception as e:
+        print(f"Error dropping records from {config.DATA_FILE}: {e}")
+        return None
+
 class SensorLogger:
     """Class to handle temperature, humidity, and material resistivity logging."""
     # ------------------------- Initialization -------------------------
@@ -12,40 +174,27 @@ class SensorLogger:
         self.i2c = machine.I2C(0, scl=machine.Pin(config.I2C_SCL_PIN), sda=machine.Pin(config.I2C_SDA_PIN), freq=400000)
         self.sensor = DHT20(0x38, self.i2c) 
         self.adc_sensor = machine.ADC(adc_channel)
-        self.conversion_factor = 3.3 / 65535
         
-        # Load existing data
+        # Make sure the data file exists (its contents are never loaded into RAM)
         self.create_file_if_not_exists()
-        self.data = self.load_from_file()
         self.start_time = start_time
         self.period = period
+        self.last_record = None
 
     # ------------------------- File Handling Methods -------------------------
     def create_file_if_not_exists(self):
-        """Check if the CSV file exists, if not create it with headers."""
-        if config.DATA_FILE not in os.listdir():
-            with open(config.DATA_FILE, "w") as file:
-                file.write(",".join(config.DATA_HEADER) + "\n")  # Add header
-            print(f"Created new file: {config.DATA_FILE}")
+        """Check if the CSV file exists with the current headers, if not create it."""
+        prepare_data_file()
 
     def append_to_file(self, record):
         """Append a new record to the CSV file."""
         try:
             with open(config.DATA_FILE, "a") as file:
-                file.write(",".join(map(str, record)) + "\n")
+                file.write(format_record(record) + "\n")
+            return True
         except Exception as e:
             print(f"Error appending to file {config.DATA_FILE}: {e}")
-
-    def load_from_file(self):
-        """Load existing data from a CSV file."""
-        if config.DATA_FILE in os.listdir():
-            try:
-                with open(config.DATA_FILE, "r") as file:
-                    lines = file.readlines()
-                    return [line.strip().split(",") for line in lines]
-            except Exception as e:
-                print(f"Error loading file {config.DATA_FILE}: {e}")
-        return [config.DATA_HEADER]
+            return False
 
     # ------------------------- Time Conversion Methods -------------------------
     def format_time(self, epoch_time):
@@ -58,49 +207,32 @@ class SensorLogger:
             return ""
 
     # ------------------------- Sensor Reading Methods -------------------------
-    def get_temperature(self):
-        """Read temperature from DHT20 sensor."""
-        try:
-            measurements = self.sensor.measurements
-            if measurements["crc_ok"]:
-                return round(measurements["t"], 2)  # Temperature value (2 decimal places)
-            else:
-                print("Warning: Invalid CRC from DHT20 sensor.")
-                return None
-        except Exception as e:
-            print(f"Error reading temperature: {e}")
-            return None
-
-    def get_humidity(self):
-        """Read humidity from DHT20 sensor."""
+    def get_temperature_humidity(self):
+        """Read raw 20-bit temperature and humidity counts from DHT20 sensor (one measurement)."""
         try:
-            measurements = self.sensor.measurements
-            if measurements["crc_ok"]:
-                return round(measurements["rh"], 2)  # Humidity value (2 decimal places)
-            else:
-                print("Warning: Invalid CRC from DHT20 sensor.")
-                return None
+            t_adc, rh_adc, crc_ok = self.sensor.raw_measurements
+            if crc_ok:
+                return t_adc, rh_adc
+            print("Warning: Invalid CRC from DHT20 sensor.")
         except Exception as e:
-            print(f"Error reading humidity: {e}")
-            return None
+            print(f"Error reading DHT20: {e}")
+        return None, None
 
     def get_cpu_temperature(self):
-        """Convert material resistivity to CPU temperature (temporary)."""
+        """Read the raw 16-bit ADC count used for CPU temperature (temporary)."""
         try:
-            sensor_value = self.adc_sensor.read_u16()
-            voltage = sensor_value * self.conversion_factor
-            return round(voltage * 100, 2)  # Convert resistance value
+            return self.adc_sensor.read_u16()
         except Exception as e:
             print(f"Error reading CPU temperature: {e}")
             return 0  # Return default value 0 in case of an error
 
     # ------------------------- Data Logging Methods -------------------------
     def get_sensor_log(self, current_time):
-        """Start logging sensor data."""
-        temperature = self.get_temperature()
-        humidity = self.get_humidity()
-        cpu_temperature = self.get_cpu_temperature() if hasattr(self, "get_cpu_temperature") else 0
+        """Start logging sensor data (raw counts, converted only on export)."""
+        temperature, humidity = self.get_temperature_humidity()
+        cpu_temperature = self.get_cpu_temperature()
         
         new_record = [current_time, temperature, humidity, cpu_temperature]
-        self.append_to_file(new_record)
+        # Only report records that actually reached the file
+        self.last_record = new_record if self.append_to_file(new_record) else None
         print(f"Logged data: {new_record}")
\ No newline at end of file
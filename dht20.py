@@ -13,6 +13,7 @@ class DHT20:
     def __init__(self, address: int, i2c: I2C):
         self._address = address
         self._i2c = i2c
+        self._buffer = bytearray(7)  # Reused for every read to keep the sample path allocation-free
         sleep_ms(100)
         
         if not self.is_ready:
@@ -35,76 +36,54 @@ class DHT20:
         self._i2c.writeto_mem(self._address, 0x1E, buffer)
     
     def _trigger_measurements(self):
-        self._i2c.writeto_mem(self._address, 0xAC, bytearray(b'\x33\x00'))
+        self._i2c.writeto_mem(self._address, 0xAC, b'\x33\x00')
         
-    def _read_measurements(self):
-        buffer = self._i2c.readfrom(self._address, 7)
-        return buffer, buffer[0] & 0x80 == 0
+    def _read_measurements(self) -> bool:
+        self._i2c.readfrom_into(self._address, self._buffer)
+        return self._buffer[0] & 0x80 == 0
     
-    def _crc_check(self, input_bitstring: str, check_value: str) -> bool:
-        """Calculate the CRC check of a string of bits using a fixed polynomial.
+    def _crc_check(self, buffer) -> bool:
+        """Verify the CRC-8 (polynomial 0x31, initial value 0xFF) sent in the last byte.
         
         See https://en.wikipedia.org/wiki/Cyclic_redundancy_check
-            https://xcore.github.io/doc_tips_and_tricks/crc.html#the-initial-value
         
         Keyword arguments:
-        input_bitstring -- the data to verify
-        check_value -- the CRC received with the data
+        buffer -- the 7 bytes read from the sensor, CRC last
         """
+        crc = 0xFF
         
-        polynomial_bitstring = "100110001"
-        len_input = len(input_bitstring)
-        initial_padding = check_value
-        input_padded_array = list(input_bitstring + initial_padding)
-        
-        while '1' in input_padded_array[:len_input]:
-            cur_shift = input_padded_array.index('1')
+        for i in range(6):
+            crc ^= buffer[i]
             
-            for i in range(len(polynomial_bitstring)):
-                input_padded_array[cur_shift + i] = \
-                    str(int(polynomial_bitstring[i] != input_padded_array[cur_shift + i]))
+            for _ in range(8):
+                crc = ((crc << 1) ^ 0x31) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
                 
-        return '1' not in ''.join(input_padded_array)[len_input:]
+        return crc == buffer[6]
         
     @property
-    def measurements(self) -> dict:
-        """Get the temperature (°C) and relative humidity (%RH).
+    def raw_measurements(self) -> tuple:
+        """Get the raw 20-bit temperature and relative humidity counts.
         
-        Returns a dictionary with the most recent measurements.
-
-        't': temperature (°C),
-        't_adc': the 'raw' temperature as produced by the ADC,
-        'rh': relative humidity (%RH),
-        'rh_adc': the 'raw' relative humidity as produced by the ADC,
-        'crc_ok': indicates if the data was received correctly
+        Returns a tuple (t_adc, rh_adc, crc_ok) of integers only, so a sample
+        can be taken without any float math. Convert with
+        data_processor.temperature_centi() / humidity_centi() where needed.
         """
         self._trigger_measurements()
         sleep_ms(50)
         
-        data = self._read_measurements()
+        ready = self._read_measurements()
         retry = 3
         
-        while not data[1]:
+        while not ready:
             if not retry:
                 raise RuntimeError("Could not read measurements from the DHT20.")
             
             sleep_ms(10)
-            data = self._read_measurements()
+            ready = self._read_measurements()
             retry -= 1
             
-        buffer = data[0]
+        buffer = self._buffer
         s_rh = buffer[1] << 12 | buffer[2] << 4 | buffer[3] >> 4
         s_t = (buffer[3] << 16 | buffer[4] << 8 | buffer[5]) & 0xfffff
-        rh = (s_rh / 2 ** 20) * 100
-        t = ((s_t / 2 ** 20) * 200) - 50
-        crc_ok = self._crc_check(
-            f"{buffer[0] ^ 0xFF:08b}{buffer[1]:08b}{buffer[2]:08b}{buffer[3]:08b}{buffer[4]:08b}{buffer[5]:08b}",
-            f"{buffer[6]:08b}")
         
-        return {
-            't': t,
-            't_adc': s_t,
-            'rh': rh,
-            'rh_adc': s_rh,
-            'crc_ok': crc_ok
-        }
\ No newline at end of file
+        return s_t, s_rh, self._crc_check(buffer)
@@ -1,7 +1,11 @@
 # main.py
 import utime
+import _thread
 from ble_manager import BLEManager
-from data_processor import SensorLogger
+from data_processor import SensorLogger, prepare_data_file, format_record
+from ring_buffer import RingBuffer
+from sampler import Sampler
+import config
 import machine
 
 # RTC initialization
@@ -87,8 +91,91 @@ def log_sensor_data(sensor_logger, period_seconds, last_logged_time):
     
     return last_logged_time  # No update
 
+# ------------------------- [Dual-Core Mode] -------------------------
+def forward_ble_command(ble_manager, commands):
+    """Core 0: set the RTC and forward new settings, sync acks and BLE names to core 1.
+
+    Only this loop puts into `commands`; the BLE callback just records what to
+    forward, so it can never wait on a lock held by the code it interrupted.
+    """
+    if ble_manager.command:
+        set_rtc_time(ble_manager.latest_time)
+        period_seconds = convert_period_to_seconds(ble_manager.period)
+
+        # Keep the command pending and retry on the next tick if the queue is full
+        if commands.put(("setting", (ble_manager.latest_time, ble_manager.period, period_seconds))):
+            ble_manager.command = None
+
+    synced_seq = ble_manager.synced_seq
+    if synced_seq > ble_manager.forwarded_seq and commands.put(("synced", synced_seq)):
+        ble_manager.forwarded_seq = synced_seq
+
+    name_version, name = ble_manager.name_update
+    if name_version > ble_manager.forwarded_name_version and commands.put(("name", name)):
+        ble_manager.forwarded_name_version = name_version
+
+def sampler_step(sampler, last_logged_time):
+    """Core 1: run one pass of the sampler loop and return the last logged time.
+
+    Errors are printed rather than raised so the thread keeps running; a setting
+    whose SensorLogger could not be built is retried on the next pass.
+    """
+    # 1. Apply commands from core 0 (settings, sync acknowledgements, BLE name)
+    try:
+        sampler.apply_commands()
+    except Exception as e:
+        print(f"⚠️ Sampler command error: {e}")
+
+    # 2. Execute sensor data logging at regular intervals
+    try:
+        sampler.apply_setting()
+        sensor_logger = sampler.sensor_logger
+        if sensor_logger is not None and sampler.period_seconds is not None:
+            logged_time = log_sensor_data(sensor_logger, sampler.period_seconds, last_logged_time)
+            if logged_time != last_logged_time and sensor_logger.last_record is not None:
+                sampler.record_logged(format_record(sensor_logger.last_record))
+            last_logged_time = logged_time
+    except Exception as e:
+        print(f"⚠️ Sampling error: {e}")
+
+    # 3. Hand records to core 0, then trim synced lines (after sampling, so it never delays a sample)
+    try:
+        sampler.hand_over()
+        sampler.trim_synced()
+    except Exception as e:
+        print(f"⚠️ Sampler file error: {e}")
+
+    return last_logged_time
+
+def sampler_loop(sampler):
+    """Core 1: log sensor data at defined intervals and hand the records to core 0"""
+    last_logged_time = None
+    while True:
+        last_logged_time = sampler_step(sampler, last_logged_time)
+        utime.sleep_ms(1000)
+
+def main_dual_core():
+    """Run BLE on core 0 while sensor sampling and flash I/O run on core 1"""
+    records = RingBuffer(config.RING_CAPACITY)  # Core 1 -> core 0: (seq, line) pairs
+    commands = RingBuffer(config.RING_CAPACITY)  # Core 0 -> core 1: settings, sync acks and BLE names
+
+    sampler = Sampler(records, commands)
+    ble_manager = BLEManager(sampler)
+    _thread.start_new_thread(sampler_loop, (sampler,))
+
+    while True:
+        forward_ble_command(ble_manager, commands)
+        utime.sleep_ms(100)
+
 # ------------------------- [Main Loop] -------------------------
 def main():
+    # Move aside a data file left in an older format before anything reads it
+    prepare_data_file()
+
+    if config.DUAL_CORE:
+        main_dual_core()
+        return
+
     # Initialize BLE
     ble_manager = BLEManager()
 
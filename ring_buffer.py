@@ -0,0 +1,43 @@
+# ring_buffer.py
+import _thread
+
+# ------------------------- [RingBuffer Class Definition] -------------------------
+class RingBuffer:
+    """Fixed-size single-producer/single-consumer queue shared between the two cores.
+
+    Slots are preallocated and neither side ever blocks: put() returns False when
+    the buffer is full and get() returns None when it is empty.
+    """
+    def __init__(self, capacity):
+        self._slots = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # Next slot to read (consumer)
+        self._count = 0
+        self._lock = _thread.allocate_lock()
+
+    def put(self, item):
+        """Add an item (producer side). Returns False if the buffer is full."""
+        with self._lock:
+            if self._count == self._capacity:
+                return False
+            self._slots[(self._head + self._count) % self._capacity] = item
+            self._count += 1
+            return True
+
+    def get(self):
+        """Remove and return the oldest item (consumer side), or None if empty."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            item = self._slots[self._head]
+            self._slots[self._head] = None  # Release the reference
+            self._head = (self._head + 1) % self._capacity
+            self._count -= 1
+            return item
+
+    def __len__(self):
+        return self._count
+
+    def free(self):
+        """Number of empty slots the producer can still fill."""
+        return self._capacity - self._count
@@ -0,0 +1,108 @@
+# sampler.py
+import config
+from data_processor import SensorLogger, HEADER_LINE, count_records, read_records, clear_records, drop_records
+
+# ------------------------- [Sampler Class Definition] -------------------------
+class Sampler:
+    """Core 1 side of dual-core mode: owns the sensor and every flash access.
+
+    The CSV file is the only full copy of unsent data. Core 0 receives its lines
+    through the `records` ring as (seq, line) pairs, where `seq` numbers data
+    lines since boot, and acknowledges sent lines by the highest `seq` it sent.
+    Only a byte offset into the file is kept here, so RAM use does not grow with
+    the amount of unsent data.
+    """
+    def __init__(self, records, commands):
+        self.records = records  # RingBuffer of (seq, line) pairs (core 1 -> core 0)
+        self.commands = commands  # RingBuffer of (action, value) commands (core 0 -> core 1)
+        self.sensor_logger = None
+        self.period_seconds = None
+        self.pending_setting = None  # Kept until the SensorLogger could be built
+
+        self.base = 0  # Sequence number of the first data line in the file
+        self.total = count_records()  # Data lines in the file
+        self.queued = 0  # Data lines already handed to core 0 (file cursor)
+        self.offset = len(HEADER_LINE)  # Byte offset of the cursor line
+        self.synced = -1  # Highest sequence number core 0 has sent
+        self.next_seq = self.total  # Sequence number of the next logged line (read by core 0)
+
+    # ------------------------- [Command Processing] -------------------------
+    def apply_commands(self):
+        """Apply settings, sync acknowledgements and BLE name changes from core 0"""
+        command = self.commands.get()
+        while command is not None:
+            action, value = command
+            if action == "setting":
+                self.pending_setting = value
+            elif action == "synced":
+                self.synced = max(self.synced, value)
+            elif action == "name":
+                self.save_ble_name(value)
+            command = self.commands.get()
+
+    def apply_setting(self):
+        """Create or update the SensorLogger (the setting is kept and retried if this raises)"""
+        if self.pending_setting is None:
+            return
+
+        start_time, period, period_seconds = self.pending_setting
+        if self.sensor_logger is None:
+            self.sensor_logger = SensorLogger(start_time, period)  # Raises if the DHT20 is missing
+        else:
+            self.sensor_logger.start_time = start_time
+            self.sensor_logger.period = period
+        self.period_seconds = period_seconds
+        self.pending_setting = None
+
+    def save_ble_name(self, name):
+        """Store the BLE name in Flash memory"""
+        try:
+            with open(config.NAME_FILE, "w") as f:
+                f.write(name)
+        except OSError as e:
+            print(f"⚠️ Error saving BLE name: {e}")
+
+    def trim_synced(self):
+        """Drop sent lines from the file (retried on every call until it succeeds)
+
+        Clearing a fully synced file only rewrites the header; partial trims copy
+        the rest of the file, so they wait until TRIM_BATCH lines are synced.
+        """
+        count = self.synced + 1 - self.base
+        if count <= 0:
+            return
+
+        if count == self.total:
+            if not clear_records():
+                return
+            self.offset = len(HEADER_LINE)
+        elif count >= config.TRIM_BATCH:
+            dropped = drop_records(count)
+            if dropped is None:
+                return
+            self.offset -= dropped
+        else:
+            return
+
+        self.base += count
+        self.total -= count
+        self.queued -= count
+
+    # ------------------------- [Record Hand-over] -------------------------
+    def record_logged(self, line):
+        """Account for a line just appended to the file, handing it over directly if possible"""
+        self.total += 1
+        self.next_seq = self.base + self.total
+        if self.queued == self.total - 1 and self.records.put((self.base + self.queued, line)):
+            self.queued += 1
+            self.offset += len(line) + 1  # Line plus newline, as written by append_to_file
+
+    def hand_over(self):
+        """Hand file lines past the cursor to core 0 while the ring buffer has room"""
+        free = self.records.free()
+        if self.queued < self.total and free:
+            lines, offset = read_records(self.offset, free)
+            for line in lines:
+                self.records.put((self.base + self.queued, line))  # Only core 1 fills the ring
+                self.queued += 1
+            self.offset = offset
@@ -0,0 +1,50 @@
+# conftest.py
+# Host harness: run the firmware modules under CPython. Only the MicroPython
+# modules imported at module level are replaced; nothing here touches hardware.
+import os
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _Device:
+    """Accepts any constructor arguments (Pin, I2C)."""
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class _ADC(_Device):
+    def read_u16(self):
+        return 0x8000
+
+
+class _RTC:
+    def datetime(self, value=None):
+        if value is None:
+            t = time.localtime()
+            return (t[0], t[1], t[2], t[6], t[3], t[4], t[5], 0)
+
+
+machine = types.ModuleType("machine")
+machine.unique_id = lambda: b"\x00\x01\x02\x03\x04\x05\x06\x07"
+machine.Pin = machine.I2C = _Device
+machine.ADC = _ADC
+machine.RTC = _RTC
+sys.modules.setdefault("machine", machine)
+
+utime = types.ModuleType("utime")
+utime.sleep_ms = lambda ms: time.sleep(ms / 1000)
+utime.localtime = time.localtime
+utime.mktime = lambda t: int(time.mktime(tuple(t[:8]) + (-1,)))  # MicroPython takes 8 fields
+sys.modules.setdefault("utime", utime)
+
+bluetooth = types.ModuleType("bluetooth")
+bluetooth.BLE = _Device
+bluetooth.UUID = lambda value: value
+sys.modules.setdefault("bluetooth", bluetooth)
+
+micropython = types.ModuleType("micropython")
+micropython.const = lambda value: value
+sys.modules.setdefault("micropython", micropython)
@@ -0,0 +1,76 @@
+# test_data_processor.py
+import pytest
+
+import config
+from data_processor import (
+    HEADER_LINE,
+    cpu_temperature_centi,
+    format_centi,
+    humidity_centi,
+    legacy_to_raw_line,
+    prepare_data_file,
+    read_records,
+    temperature_centi,
+    to_units_line,
+)
+
+T_MAX = (1 << 20) - 1
+
+
+@pytest.mark.parametrize("count, expected", [(0, -5000), (1 << 19, 5000), (T_MAX, 15000)])
+def test_temperature_centi(count, expected):
+    assert temperature_centi(count) == expected
+    assert abs(temperature_centi(count) - ((count / 2 ** 20) * 200 - 50) * 100) <= 1
+
+
+@pytest.mark.parametrize("count, expected", [(0, 0), (1 << 19, 5000), (T_MAX, 10000)])
+def test_humidity_centi(count, expected):
+    assert humidity_centi(count) == expected
+    assert abs(humidity_centi(count) - (count / 2 ** 20) * 100 * 100) <= 1
+
+
+@pytest.mark.parametrize("count, expected", [(0, 0), (32768, 16500), (65535, 33000)])
+def test_cpu_temperature_centi(count, expected):
+    assert cpu_temperature_centi(count) == expected
+    assert abs(cpu_temperature_centi(count) - count * 3.3 / 65535 * 100 * 100) <= 1
+
+
+@pytest.mark.parametrize("value, text", [(2345, "23.45"), (0, "0.00"), (-5, "-0.05"), (-5000, "-50.00"), (-1234, "-12.34")])
+def test_format_centi(value, text):
+    assert format_centi(value) == text
+
+
+def test_to_units_line_converts_counts_and_passes_none_through():
+    assert to_units_line("2025-01-01T00:00:00,524288,524288,65535") == "2025-01-01T00:00:00,50.00,50.00,330.00"
+    assert to_units_line("2025-01-01T00:00:00,None,None,0") == "2025-01-01T00:00:00,None,None,0.00"
+    assert to_units_line("not,a,record") == "not,a,record"
+
+
+def test_legacy_line_round_trips_through_raw_counts():
+    raw = legacy_to_raw_line("2025-01-01T00:00:00,23.45,45.67,None")
+    assert raw.split(",")[3] == "None"
+    assert to_units_line(raw) == "2025-01-01T00:00:00,23.45,45.67,None"
+
+
+def test_prepare_data_file_migrates_legacy_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open(config.DATA_FILE, "w") as file:
+        file.write(",".join(config.LEGACY_DATA_HEADER) + "\n")
+        file.write("2025-01-01T00:00:00,-50.0,0.0,0.0\n")
+
+    prepare_data_file()
+
+    with open(config.DATA_FILE) as file:
+        assert file.readline().strip() == ",".join(config.DATA_HEADER)
+    assert read_records(len(HEADER_LINE), 10)[0] == ["2025-01-01T00:00:00,0,0,0"]
+
+
+def test_prepare_data_file_moves_unknown_file_aside(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open(config.DATA_FILE, "w") as file:
+        file.write("something,else\n1,2\n")
+
+    prepare_data_file()
+
+    assert (tmp_path / config.OLD_DATA_FILE).read_text() == "something,else\n1,2\n"
+    assert read_records(len(HEADER_LINE), 10)[0] == []
@@ -0,0 +1,42 @@
+# test_dht20.py
+from dht20 import DHT20
+
+GOOD_FRAME = bytes([0x1C, 0x6B, 0x3A, 0x25, 0x5D, 0x1C, 0xC7])  # CRC-8 0xC7 checked against the old bit-string CRC
+
+
+class FakeI2C:
+    """Answers like a ready DHT20 that always returns `frame`."""
+    def __init__(self, frame):
+        self.frame = frame
+
+    def writeto(self, address, data):
+        pass
+
+    def readfrom(self, address, count):
+        return bytes([0x18])  # Status: calibrated and idle
+
+    def writeto_mem(self, address, register, data):
+        pass
+
+    def readfrom_into(self, address, buffer):
+        buffer[:] = self.frame
+
+
+def test_crc_accepts_good_frame_and_rejects_corruption():
+    sensor = DHT20(0x38, FakeI2C(GOOD_FRAME))
+    assert sensor._crc_check(GOOD_FRAME)
+
+    corrupted = bytearray(GOOD_FRAME)
+    corrupted[3] ^= 0x01
+    assert not sensor._crc_check(corrupted)
+    assert not sensor._crc_check(GOOD_FRAME[:6] + b"\x00")
+
+
+def test_raw_measurements_extracts_20_bit_counts():
+    sensor = DHT20(0x38, FakeI2C(GOOD_FRAME))
+    assert sensor.raw_measurements == (351516, 439202, True)
+
+    corrupted = bytearray(GOOD_FRAME)
+    corrupted[5] ^= 0x80
+    sensor = DHT20(0x38, FakeI2C(bytes(corrupted)))
+    assert sensor.raw_measurements[2] is False
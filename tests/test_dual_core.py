@@ -0,0 +1,194 @@
+# test_dual_core.py
+# Threads stand in for the two cores and run the shipped code on each side:
+# core 1 runs main.sampler_step with a real SensorLogger (fake DHT20), core 0
+# drives the real BLEManager through on_rx plus main.forward_ble_command.
+import json
+import threading
+import time
+import types
+
+import pytest
+
+import ble_manager as ble_manager_module
+import config
+import data_processor
+import main
+from ble_manager import BLEManager
+from ring_buffer import RingBuffer
+from sampler import Sampler
+
+UPDATE = json.dumps({"command": "update", "period": "00:00:01"}).encode()
+
+
+class FakeDHT20:
+    def __init__(self, address, i2c):
+        self.count = 0
+
+    @property
+    def raw_measurements(self):
+        self.count += 1
+        return self.count, self.count, True
+
+
+class TickingRTC:
+    """Advances one second per read, up to `ticks` times; sets are ignored."""
+    def __init__(self, ticks):
+        self.now = 1735689600  # 2025-01-01 00:00:00 UTC
+        self.ticks = ticks
+
+    def datetime(self, value=None):
+        if value is not None:
+            return
+        t = time.gmtime(self.now)
+        if self.ticks:
+            self.now += 1
+            self.ticks -= 1
+        return (t[0], t[1], t[2], t[6], t[3], t[4], t[5], 0)
+
+
+class StubPeripheral:
+    """Collects notifications; raises on the batch sends listed in `fail_sends` (1-based)."""
+    def __init__(self, ble, name, interval):
+        self.sent = []
+        self.sends = 0
+        self.fail_sends = set()
+
+    def on_write(self, callback):
+        pass
+
+    def is_connected(self):
+        return True
+
+    def send(self, data):
+        message = json.loads(data)
+        if "batch" in message:
+            self.sends += 1
+            if self.sends in self.fail_sends:
+                raise OSError("notify failed")
+        self.sent.append(message)
+
+
+@pytest.fixture(autouse=True)
+def device(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_processor, "DHT20", FakeDHT20)
+    monkeypatch.setattr(ble_manager_module, "BLEPeripheral", StubPeripheral)
+    monkeypatch.setattr(ble_manager_module, "time", types.SimpleNamespace(sleep=lambda seconds: None))
+    data_processor.prepare_data_file()
+
+
+def make_device(backlog=0, capacity=8):
+    lines = [f"old{i},1,2,3" for i in range(backlog)]
+    with open(config.DATA_FILE, "a") as file:
+        for line in lines:
+            file.write(line + "\n")
+    commands = RingBuffer(capacity)
+    sampler = Sampler(RingBuffer(capacity), commands)
+    return sampler, BLEManager(sampler), commands, lines
+
+
+def update(ble):
+    """Send one 'update' like the host does; return (response, lines, sent OK)."""
+    start = len(ble.perip.sent)
+    ble.on_rx(UPDATE)
+    messages = ble.perip.sent[start:]
+    response = messages[-1]
+    lines = [line for message in messages if "batch" in message for line in message["data"]]
+    return response, lines, response["status"] == "success"
+
+
+def test_failed_send_keeps_pending_and_resends_it():
+    sampler, ble, commands, lines = make_device(backlog=15, capacity=32)
+    sampler.hand_over()
+
+    ble.perip.fail_sends = {2}  # Second batch fails
+    response, _, ok = update(ble)
+    assert not ok and response["remaining"] == 15
+    assert len(ble.pending) == 15 and ble.synced_seq == -1
+
+    response, sent, ok = update(ble)
+    assert ok and sent == lines and response["remaining"] == 0
+
+    main.forward_ble_command(ble, commands)
+    sampler.apply_commands()
+    sampler.trim_synced()
+    assert data_processor.count_records() == 0
+
+
+def test_ble_name_change_is_written_by_core_1(tmp_path):
+    sampler, ble, commands, _ = make_device()
+    ble.set_ble_name("MedMTEST")
+    assert not (tmp_path / config.NAME_FILE).exists()
+
+    main.forward_ble_command(ble, commands)
+    main.sampler_step(sampler, None)
+    assert (tmp_path / config.NAME_FILE).read_text() == "MedMTEST"
+
+
+def test_missing_sensor_does_not_stop_core_1(monkeypatch):
+    sampler, ble, commands, _ = make_device()
+    monkeypatch.setattr(main, "rtc", TickingRTC(10))
+
+    def missing_sensor(address, i2c):
+        raise RuntimeError("Could not initialize the DHT20.")
+
+    monkeypatch.setattr(data_processor, "DHT20", missing_sensor)
+    ble.on_rx(UPDATE)
+    main.forward_ble_command(ble, commands)
+    last_logged_time = main.sampler_step(sampler, None)  # Must not raise
+    assert sampler.sensor_logger is None and sampler.pending_setting is not None
+
+    monkeypatch.setattr(data_processor, "DHT20", FakeDHT20)
+    main.sampler_step(sampler, last_logged_time)
+    assert sampler.sensor_logger is not None and sampler.next_seq == 1
+
+
+def test_threads_as_cores_deliver_every_record_once_in_order(monkeypatch):
+    backlog, samples = 40, 200
+    monkeypatch.setattr(config, "TRIM_BATCH", 16)
+    monkeypatch.setattr(main, "rtc", TickingRTC(samples - 1))
+    sampler, ble, commands, lines = make_device(backlog=backlog)
+    ble.perip.fail_sends = set(range(5, 10000, 7))  # Some syncs fail part-way through
+
+    ble.on_rx(UPDATE)  # Start logging (period 1 s, one RTC second per pass)
+    main.forward_ble_command(ble, commands)
+
+    done = threading.Event()
+    errors = []
+
+    def core1():
+        last_logged_time = None
+        while not done.is_set():
+            last_logged_time = main.sampler_step(sampler, last_logged_time)
+            time.sleep(0)
+
+    received = []
+
+    def core0():
+        try:
+            deadline = time.time() + 60
+            while time.time() < deadline:
+                response, sent, ok = update(ble)
+                if ok:  # The host keeps only syncs that completed
+                    received.extend(sent)
+                main.forward_ble_command(ble, commands)
+                if ok and response["remaining"] == 0 and len(received) >= backlog + samples:
+                    return
+                time.sleep(0)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=core1), threading.Thread(target=core0)]
+    for thread in threads:
+        thread.start()
+    threads[1].join(timeout=90)
+    deadline = time.time() + 10
+    while data_processor.count_records() and time.time() < deadline:  # Let core 1 apply the last ack
+        time.sleep(0.01)
+    done.set()
+    threads[0].join(timeout=10)
+
+    assert not errors
+    assert received[:backlog] == lines
+    assert [int(line.split(",")[1]) for line in received[backlog:]] == list(range(1, samples + 1))
+    assert data_processor.count_records() == 0
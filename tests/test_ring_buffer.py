@@ -0,0 +1,59 @@
+# test_ring_buffer.py
+import threading
+import time
+
+from ring_buffer import RingBuffer
+
+
+def test_full_and_empty():
+    ring = RingBuffer(3)
+    assert ring.get() is None
+    assert all(ring.put(i) for i in range(3))
+    assert ring.put(3) is False
+    assert len(ring) == 3 and ring.free() == 0
+    assert [ring.get() for _ in range(4)] == [0, 1, 2, None]
+    assert len(ring) == 0 and ring.free() == 3
+
+
+def test_wraps_around_in_fifo_order():
+    ring = RingBuffer(4)
+    out = []
+    for i in range(10):
+        assert ring.put(i)
+        if i % 2:
+            out.append(ring.get())
+            out.append(ring.get())
+    assert out == list(range(10))
+
+
+def test_threads_as_cores_lose_and_duplicate_nothing():
+    """One producer thread (core 1) and one consumer thread (core 0) share a small ring."""
+    ring = RingBuffer(8)
+    count = 20000
+    received = []
+
+    def producer():
+        i = 0
+        while i < count:
+            if ring.put(i):
+                i += 1
+            else:
+                time.sleep(0)  # Full: let the consumer run
+
+    def consumer():
+        while len(received) < count:
+            item = ring.get()
+            if item is not None:
+                received.append(item)
+            else:
+                time.sleep(0)  # Empty: let the producer run
+
+    threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert received == list(range(count))
+    assert len(ring) == 0
@@ -0,0 +1,179 @@
+# test_sampler.py
+import os
+
+import pytest
+
+import config
+import data_processor
+import sampler as sampler_module
+from ring_buffer import RingBuffer
+from sampler import Sampler
+
+SETTING = ("2025-01-01 00:00:00", "00:00:01", 1)
+
+
+class FakeSensorLogger:
+    """Stands in for SensorLogger: appends numbered records without touching I2C/ADC."""
+    def __init__(self, start_time, period):
+        self.start_time = start_time
+        self.period = period
+        self.count = 0
+
+    def log(self):
+        line = data_processor.format_record([f"t{self.count}", self.count, self.count, 0])
+        with open(config.DATA_FILE, "a") as file:
+            file.write(line + "\n")
+        self.count += 1
+        return line
+
+
+@pytest.fixture(autouse=True)
+def data_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sampler_module, "SensorLogger", FakeSensorLogger)
+    data_processor.prepare_data_file()
+
+
+def write_lines(count):
+    lines = [f"old{i},1,2,3" for i in range(count)]
+    with open(config.DATA_FILE, "a") as file:
+        for line in lines:
+            file.write(line + "\n")
+    return lines
+
+
+def file_lines():
+    return data_processor.read_records(len(data_processor.HEADER_LINE), 10000)[0]
+
+
+def drain(ring):
+    items = []
+    item = ring.get()
+    while item is not None:
+        items.append(item)
+        item = ring.get()
+    return items
+
+
+def ack(sampler, seq):
+    sampler.commands.put(("synced", seq))
+    sampler.apply_commands()
+    sampler.trim_synced()
+
+
+def test_boot_backlog_is_handed_over_through_a_bounded_ring():
+    lines = write_lines(25)
+    sampler = Sampler(RingBuffer(4), RingBuffer(4))
+    assert sampler.next_seq == 25
+
+    received = []
+    while len(received) < 25:
+        sampler.hand_over()
+        assert len(sampler.records) <= 4
+        batch = drain(sampler.records)
+        received.extend(batch)
+        ack(sampler, batch[-1][0])
+
+    assert [seq for seq, _ in received] == list(range(25))
+    assert [line for _, line in received] == lines
+    assert data_processor.count_records() == 0
+
+
+def test_new_lines_follow_backlog_and_cursor_tracks_direct_hand_over():
+    lines = write_lines(3)
+    sampler = Sampler(RingBuffer(8), RingBuffer(8))
+    sampler.commands.put(("setting", SETTING))
+    sampler.apply_commands()
+    sampler.apply_setting()
+    assert isinstance(sampler.sensor_logger, FakeSensorLogger)
+    assert sampler.period_seconds == 1
+
+    # A new sample must not jump ahead of older lines still in the file
+    first = sampler.sensor_logger.log()
+    sampler.record_logged(first)
+    sampler.hand_over()
+    assert [line for _, line in drain(sampler.records)] == lines + [first]
+
+    # Cursor is at the end: the next line goes straight into the ring, and the
+    # byte offset must still point past it for later reads from the file
+    second = sampler.sensor_logger.log()
+    sampler.record_logged(second)
+    third = sampler.sensor_logger.log()
+    sampler.record_logged(third)
+    assert drain(sampler.records) == [(4, second), (5, third)]
+    assert data_processor.read_records(sampler.offset, 10)[0] == []
+
+
+def test_setting_is_kept_until_the_logger_can_be_built(monkeypatch):
+    attempts = []
+
+    def missing_sensor(start_time, period):
+        attempts.append(start_time)
+        raise RuntimeError("Could not initialize the DHT20.")
+
+    monkeypatch.setattr(sampler_module, "SensorLogger", missing_sensor)
+    sampler = Sampler(RingBuffer(4), RingBuffer(4))
+    sampler.commands.put(("setting", SETTING))
+    sampler.apply_commands()
+    with pytest.raises(RuntimeError):
+        sampler.apply_setting()
+    assert sampler.pending_setting == SETTING and sampler.sensor_logger is None
+
+    monkeypatch.setattr(sampler_module, "SensorLogger", FakeSensorLogger)
+    sampler.apply_setting()
+    assert sampler.sensor_logger is not None and sampler.pending_setting is None
+    assert len(attempts) == 1
+
+
+def test_partial_acks_are_batched_and_full_ack_only_rewrites_header(monkeypatch):
+    monkeypatch.setattr(config, "TRIM_BATCH", 4)
+    lines = write_lines(10)
+    sampler = Sampler(RingBuffer(16), RingBuffer(16))
+    sampler.hand_over()
+    drain(sampler.records)
+
+    dropped = []
+    real_drop = data_processor.drop_records
+    monkeypatch.setattr(sampler_module, "drop_records", lambda count: dropped.append(count) or real_drop(count))
+
+    ack(sampler, 2)  # 3 lines: below the batch size, file untouched
+    assert dropped == [] and file_lines() == lines
+
+    ack(sampler, 5)  # 6 lines: one copy drops them all
+    assert dropped == [6] and file_lines() == lines[6:]
+    assert sampler.base == 6 and sampler.queued == 4
+
+    ack(sampler, 9)  # Everything synced: header-only rewrite, no copy
+    assert dropped == [6] and file_lines() == []
+    assert sampler.offset == len(data_processor.HEADER_LINE)
+
+
+def test_failed_trim_is_retried_by_sequence_number(monkeypatch):
+    monkeypatch.setattr(config, "TRIM_BATCH", 1)
+    lines = write_lines(6)
+    sampler = Sampler(RingBuffer(8), RingBuffer(8))
+    sampler.hand_over()
+    sent = drain(sampler.records)[:4]
+
+    real_drop = data_processor.drop_records
+    monkeypatch.setattr(sampler_module, "drop_records", lambda count: None)
+    ack(sampler, sent[1][0])
+    assert data_processor.count_records() == 6
+
+    # A later ack covers both the failed and the new trim
+    monkeypatch.setattr(sampler_module, "drop_records", real_drop)
+    ack(sampler, sent[3][0])
+    assert file_lines() == lines[4:]
+    assert sampler.base == 4 and sampler.queued == 2
+
+    # The cursor still matches the file after the trim moved it
+    assert sampler.offset == os.path.getsize(config.DATA_FILE)
+    sampler.record_logged(write_lines(1)[0])
+    assert sampler.offset == os.path.getsize(config.DATA_FILE)
+
+
+def test_ble_name_is_saved_on_core_1(tmp_path):
+    sampler = Sampler(RingBuffer(4), RingBuffer(4))
+    sampler.commands.put(("name", "MedMTEST"))
+    sampler.apply_commands()
+    assert (tmp_path / config.NAME_FILE).read_text() == "MedMTEST"